@@ -1,8 +1,20 @@
-import json
+import sys
 import asyncio
-import inspect
-import contextlib
-from typing import Any, Dict, Optional, Generator, Type, List
+from functools import partial
+from typing import Any, Dict, Optional, Type, List, Union
+
+from json import JSONDecoder, JSONDecodeError, loads as _json_loads_compat
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    _json_decode = JSONDecoder().decode
+
+    def _json_loads(data: Union[str, bytes]) -> Any:
+        # 文本帧直接使用预先创建的解码器，跳过 json.loads 的参数处理
+        if isinstance(data, str):
+            return _json_decode(data)
+        return _json_loads_compat(data)
 
 from nonebot.adapters import Adapter as BaseAdapter
 from nonebot.drivers import (
@@ -16,20 +28,15 @@ from nonebot.exception import WebSocketClosed
 from nonebot.typing import overrides
 from nonebot.utils import escape_tag, logger_wrapper
 
-from . import event
 from .bot import Bot
-from .event import Event
+from .event import Event, EVENT_MODELS
+from .config import Config
 from .collator import Collator
-from .utils import get_connections
+from .utils import decode_self_name
 
 log = logger_wrapper("Spigot")
 
-DEFAULT_MODELS: List[Type[Event]] = []
-for model_name in dir(event):
-    model = getattr(event, model_name)
-    if not inspect.isclass(model) or not issubclass(model, Event):
-        continue
-    DEFAULT_MODELS.append(model)
+DEFAULT_MODELS: List[Type[Event]] = list(EVENT_MODELS)
 
 
 class Adapter(BaseAdapter):
@@ -45,6 +52,7 @@ class Adapter(BaseAdapter):
     @overrides(BaseAdapter)
     def __init__(self, driver: Driver, **kwargs: Any):
         super().__init__(driver, **kwargs)
+        self.spigot_config: Config = Config(**self.config.dict())
         self.connections: Dict[str, WebSocket] = {}
         self._setup()
 
@@ -65,7 +73,8 @@ class Adapter(BaseAdapter):
         pass
 
     async def _handle_ws(self, websocket: WebSocket) -> None:
-        self_name = websocket.request.headers.get("x-self-name").encode('utf-8').decode('unicode_escape')
+        raw_name = websocket.request.headers.get("x-self-name")
+        self_name = decode_self_name(raw_name) if raw_name else None
 
         # check self_name
         if not self_name:
@@ -77,20 +86,54 @@ class Adapter(BaseAdapter):
             await websocket.close(1008, "Duplicate X-Self-Name")
             return
 
+        self_name = sys.intern(self_name)
         await websocket.accept()
         bot = Bot(self, self_name)
         self.connections[self_name] = websocket
-        get_connections[self_name] = websocket
         self.bot_connect(bot)
 
         log("INFO", f"<y>Bot {escape_tag(self_name)}</y> connected")
 
+        # 默认在接收循环中依次处理事件；允许并发时交由固定数量的常驻任务处理
+        dispatch = partial(self._handle_event, bot)
+        workers: List["asyncio.Task[None]"] = []
+        if (concurrency := self.spigot_config.spigot_max_concurrent_handlers) > 1:
+            queue: "asyncio.Queue[Optional[Event]]" = asyncio.Queue(
+                self.spigot_config.spigot_event_queue_size
+            )
+            dispatch = queue.put
+            workers.extend(
+                asyncio.create_task(self._event_worker(bot, queue))
+                for _ in range(concurrency)
+            )
+
         try:
+            # 接收循环中的属性查找提前绑定为局部变量
+            # 服务端以二进制帧发送时直接读取 bytes，省去文本帧的 UTF-8 解码
+            receive = (
+                websocket.receive_bytes
+                if self.spigot_config.spigot_binary_frames
+                else websocket.receive
+            )
+            loads = _json_loads
+            json_to_event = self.json_to_event
             while True:
-                data = await websocket.receive()
-                json_data = json.loads(data)
-                if event := self.json_to_event(json_data, self_name):
-                    asyncio.create_task(bot.handle_event(event))
+                data = await receive()
+                try:
+                    json_data = loads(data)
+                except JSONDecodeError:
+                    # orjson 不接受 NaN、单独的代理字符等 json 模块允许的写法，失败时用 json 模块重试
+                    try:
+                        json_data = _json_loads_compat(data)
+                    except JSONDecodeError as e:
+                        log(
+                            "WARNING",
+                            f"Invalid JSON from bot {escape_tag(self_name)}, ignored",
+                            e,
+                        )
+                        continue
+                if event := json_to_event(json_data, self_name):
+                    await dispatch(event)
         except WebSocketClosed as e:
             log("WARNING", f"WebSocket for Bot {escape_tag(self_name)} closed by peer")
         except Exception as e:
@@ -101,20 +144,56 @@ class Adapter(BaseAdapter):
                 e,
             )
         finally:
-            with contextlib.suppress(Exception):
+            # 与逐个处理时一致，已接收的事件全部处理完毕后再关闭连接
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers, return_exceptions=True)
+            try:
                 await websocket.close()
+            except Exception:
+                pass
             self.connections.pop(self_name, None)
             self.bot_disconnect(bot)
 
+    @staticmethod
+    async def _event_worker(bot: Bot, queue: "asyncio.Queue[Optional[Event]]") -> None:
+        """持续从队列取出事件并处理，收到 None 时退出。"""
+        while (event := await queue.get()) is not None:
+            await Adapter._handle_event(bot, event)
+
+    @staticmethod
+    async def _handle_event(bot: Bot, event: Event) -> None:
+        """处理单个事件，异常仅记录日志而不中断连接。"""
+        try:
+            await bot.handle_event(event)
+        except Exception as e:
+            log(
+                "ERROR",
+                f"<r><bg #f8bbd0>Error while handle event for bot "
+                f"{escape_tag(bot.self_id)}.</bg #f8bbd0></r>",
+                e,
+            )
+
     @classmethod
-    def get_event_model(
-            cls, data: Dict[str, Any]
-    ) -> Generator[Type[Event], None, None]:
+    def get_event_model(cls, data: Dict[str, Any]) -> List[Type[Event]]:
         """根据事件获取对应 `Event Model` 及 `FallBack Event Model` 列表。"""
-        yield from cls.event_models.get_model(data)
+        return cls.event_models.get_model(data)
+
+    @staticmethod
+    def _parse_base_event(json_data: Dict[str, Any]) -> Event:
+        """解析基础 Event。
+
+        基础 Event 仅含字符串字段，字段齐全且均为字符串时校验无额外作用，直接 `construct`。
+        """
+        for field in Event.__fields__.values():
+            if not isinstance(json_data.get(field.alias), str):
+                return Event.parse_obj(json_data)
+        return Event.construct(**json_data)
 
     @classmethod
-    def json_to_event(cls, json_data: Any, self_name: Optional[str] = None) -> Optional[Event]:
+    def json_to_event(
+            cls, json_data: Any, self_name: Optional[str] = None
+    ) -> Optional[Event]:
         """将 json 数据转换为 Event 对象。
 
         如果为 API 调用返回数据且提供了 Event 对应 Bot，则将数据存入 ResultStore。
@@ -129,17 +208,37 @@ class Adapter(BaseAdapter):
         if not isinstance(json_data, dict):
             return None
 
+        model_error: Optional[Exception] = None
+
+        # 绝大多数事件可直接按 (post_type, event_name) 命中模型，无需遍历搜索树
+        if exact_model := cls.event_models.get_exact_model(json_data):
+            try:
+                return exact_model.parse_obj(json_data)
+            except Exception as e:
+                model_error = e
+
         try:
-            for model in cls.get_event_model(json_data):
-                try:
-                    event = model.parse_obj(json_data)
-                    break
-                except Exception as e:
-                    log("DEBUG", "Event Parser Error", e)
-            else:
-                event = Event.parse_obj(json_data)
-
-            return event
+            # 缺少事件类型字段的数据不会命中任何模型，直接交给基础 Event
+            if (
+                    json_data.get("post_type") is not None
+                    or json_data.get("event_name") is not None
+            ):
+                for model in cls.get_event_model(json_data):
+                    # 基础 Event 统一交由 _parse_base_event 处理
+                    if model is exact_model or model is Event:
+                        continue
+                    try:
+                        event = model.parse_obj(json_data)
+                    except Exception as e:
+                        model_error = e
+                        continue
+                    # 更具体的模型解析失败时记录最后一次错误，避免回退结果掩盖问题
+                    if model_error is not None:
+                        log("DEBUG", "Event Parser Error", model_error)
+                    return event
+            if model_error is not None:
+                log("DEBUG", "Event Parser Error", model_error)
+            return cls._parse_base_event(json_data)
         except Exception as e:
             log(
                 "ERROR",
@@ -148,5 +247,5 @@ class Adapter(BaseAdapter):
                 e,
             )
 
-    def get_connections(self):
+    def get_connections(self) -> Dict[str, WebSocket]:
         return self.connections
@@ -4,12 +4,11 @@ from nonebot.adapters import Bot as BaseBot
 from nonebot.message import handle_event
 from nonebot.typing import overrides
 
-from .utils import get_connections
 from .event import Event
 from .message import Message, MessageSegment
 
 if TYPE_CHECKING:
-    from nonebot.internal.adapter import Adapter
+    from .adapter import Adapter
 
 
 class Bot(BaseBot):
@@ -38,7 +37,7 @@ class Bot(BaseBot):
         else:
             return
         messageDict = '{"message": ' + str(messageList) + '}'
-        await get_connections[event.server_name].send_text(data=messageDict)
+        await self.adapter.get_connections()[event.server_name].send_text(data=messageDict)
 
     async def handle_event(self, event: Event) -> None:
         """处理收到的事件。"""
@@ -31,6 +31,7 @@ class Collator(Generic[E]):
         self.keys = keys
 
         self.tree = StringTrie(separator=SEPARATOR)
+        self.exact_models: Dict[Tuple[Optional[str], ...], Type[E]] = {}
         self._refresh_tree()
 
     def add_model(self, *model: Type[E]):
@@ -41,8 +42,16 @@ class Collator(Generic[E]):
         key = self._key_from_dict(data)
         return [model.value for model in self.tree.prefixes(key)][::-1]
 
+    def get_exact_model(self, data: Dict[str, Any]) -> Optional[Type[E]]:
+        """按全部键值直接查找完全匹配的模型，未命中或键值非字符串时返回 None。"""
+        key = tuple(map(data.get, self.keys))
+        if not all(isinstance(value, str) for value in key):
+            return
+        return self.exact_models.get(key)
+
     def _refresh_tree(self):
         self.tree.clear()
+        self.exact_models.clear()
         for model in self.models:
             key = self._key_from_model(model)
             if key in self.tree:
@@ -51,6 +60,22 @@ class Collator(Generic[E]):
                     f'Model for key "{key}" {self.tree[key]} is overridden by {model}',
                 )
             self.tree[key] = model
+            if exact_key := self._exact_key_from_model(model):
+                self.exact_models[exact_key] = model
+
+    def _exact_key_from_model(
+            self, model: Type[E]
+    ) -> Optional[Tuple[Optional[str], ...]]:
+        keys: List[Optional[str]] = []
+        for key in self.keys:
+            if isinstance(key, tuple):
+                return
+            field = self._get_model_field(model, key)
+            value = field and self._get_literal_field_default(field)
+            if not value:
+                return
+            keys.append(value)
+        return tuple(keys)
 
     def _key_from_dict(self, data: Dict[str, Any]) -> str:
         keys: List[Optional[str]] = []
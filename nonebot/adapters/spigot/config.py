@@ -2,6 +2,13 @@ from pydantic import Extra, BaseModel
 
 
 class Config(BaseModel):
+    spigot_binary_frames: bool = False
+    """服务端是否以二进制帧发送 JSON 数据，开启后按 bytes 接收"""
+    spigot_max_concurrent_handlers: int = 1
+    """每个连接同时处理的事件数，为 1 时按接收顺序逐个处理"""
+    spigot_event_queue_size: int = 1024
+    """每个连接待处理事件队列的容量，仅在并发处理时使用，队列满时暂停接收，连接断开时仍会处理完已接收的事件"""
+
     class Config:
         extra = Extra.ignore
         allow_population_by_field_name = True
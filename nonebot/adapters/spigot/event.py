@@ -1,4 +1,4 @@
-from typing import Optional, Literal
+from typing import Optional, Literal, Tuple, Type
 
 from nonebot.typing import overrides
 from pydantic import BaseModel
@@ -129,3 +129,15 @@ class PlayerDeathEvent(NoticeEvent):
     @overrides(Event)
     def get_event_description(self) -> str:
         return f"Notice Joined from {self.player.nickname}@[Server:{self.server_name}]: Death"
+
+
+EVENT_MODELS: Tuple[Type[Event], ...] = (
+    AsyncPlayerChatEvent,
+    PlayerJoinEvent,
+    PlayerQuitEvent,
+    PlayerDeathEvent,
+    MessageEvent,
+    NoticeEvent,
+    Event,
+)
+"""适配器默认注册的事件模型，查找按键值进行，排列顺序不影响匹配效率"""
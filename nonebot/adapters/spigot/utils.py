@@ -1,5 +1,12 @@
-from typing import Dict
+def decode_self_name(raw: str) -> str:
+    """解码 `X-Self-Name` 请求头。
 
-from nonebot.drivers import WebSocket
-
-get_connections: Dict[str, WebSocket] = {}
+    MC_QQ 插件会将服务器名转义为 `\\uXXXX` 形式发送，其余情况按 HTTP 头的
+    latin-1 编码还原为 UTF-8 文本。
+    """
+    try:
+        if "\\u" in raw:
+            return raw.encode("ascii", "backslashreplace").decode("unicode_escape")
+        return raw.encode("latin-1").decode("utf-8")
+    except UnicodeError:
+        return raw
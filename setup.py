@@ -12,7 +12,7 @@ setuptools.setup(
     long_description=long_description,  # 加长版描述？
     long_description_content_type="text/markdown",  # 描述使用Markdown
     url="https://github.com/17TheWord/nonebot-adapter-spigot",  # 项目地址
-    packages=setuptools.find_namespace_packages(),  # 无需修改
+    packages=setuptools.find_namespace_packages(include=["nonebot.adapters.*"]),
     classifiers=[
         "Programming Language :: Python :: 3.9",  # 使用Python3.10
         "License :: OSI Approved :: GNU Affero General Public License v3",  # 开源协议
@@ -21,5 +21,6 @@ setuptools.setup(
     install_requires=[
         'nonebot2>=2.0.0rc3',
         'websockets>=10.3',
+        'orjson>=3.9',
     ],
 )